@@ -1,52 +1,115 @@
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Mapping, Optional, Union
 
+# Values of boolean environment variables that are interpreted as true
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
 
-class ScoutFSConfig:
-    """Configuration helper for ScoutFS connections.
+# URL schemes accepted for the API URL
+_URL_SCHEMES = ("http://", "https://")
+_URL_MSG = "API URL must start with http:// or https://"
+_AUTH_MSG = "Both username and password must be provided for authentication"
 
-    This class handles loading and managing configuration for ScoutFS connections,
-    with support for environment variables and programmatic overrides.
 
-    Attributes
+def _env_num(name: str, default: str, cast: Callable[[str], Any]) -> Any:
+    """Read a numeric environment variable.
+
+    Parameters
     ----------
-    DEFAULT_CONFIG : dict
-        Dictionary containing default configuration values loaded from environment variables.
-        Includes API settings, authentication, SSL/TLS, timeouts, and retry logic.
+    name : str
+        Name of the environment variable
+    default : str
+        Value to use when the variable is not set
+    cast : callable
+        Conversion applied to the raw string, e.g. ``int`` or ``float``
+
+    Returns
+    -------
+    int or float
+        The converted value
     """
+    return cast(os.environ.get(name, default))
 
-    # Default configuration values
-    DEFAULT_CONFIG = {
-        # Base URL for the ScoutFS API
-        "api_url": os.environ.get(
-            "SCOUTFS_API_URL",
+
+def _build_defaults() -> Dict[str, Any]:
+    """Build the default configuration from environment variables.
+
+    Called once at import to populate :attr:`ScoutFSConfig.DEFAULT_CONFIG`
+    and again by :meth:`ScoutFSConfig.reload_defaults`.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the default configuration values
+    """
+    # Base URL for the ScoutFS API; only assembled from its parts when no
+    # explicit URL is set
+    api_url = os.environ.get("SCOUTFS_API_URL")
+    if api_url is None:
+        api_url = (
             f"https://{os.environ.get('SCOUTFS_API_HOST', 'my.scoutfs.host')}:"
             f"{os.environ.get('SCOUTFS_API_PORT', '8080')}/"
-            f"v{os.environ.get('SCOUTFS_API_VERSION', '1')}",
-        ),
+            f"v{os.environ.get('SCOUTFS_API_VERSION', '1')}"
+        )
+
+    return {
+        "api_url": api_url,
         # Authentication
         "username": os.environ.get("SCOUTFS_USERNAME"),
         "password": os.environ.get("SCOUTFS_PASSWORD"),
         # SSL/TLS settings
-        "ssl_verify": os.environ.get("SCOUTFS_SSL_VERIFY", "False").lower()
-        == "true",
+        "ssl_verify": os.environ.get("SCOUTFS_SSL_VERIFY", "").lower()
+        in _TRUTHY,
         "ssl_cert": os.environ.get("SCOUTFS_SSL_CERT"),
         # Timeout settings (in seconds)
-        "connect_timeout": float(
-            os.environ.get("SCOUTFS_CONNECT_TIMEOUT", "30.0")
-        ),
-        "request_timeout": float(
-            os.environ.get("SCOUTFS_REQUEST_TIMEOUT", "300.0")
-        ),
+        "connect_timeout": _env_num("SCOUTFS_CONNECT_TIMEOUT", "30.0", float),
+        "request_timeout": _env_num("SCOUTFS_REQUEST_TIMEOUT", "300.0", float),
         # Retry settings
-        "max_retries": int(os.environ.get("SCOUTFS_MAX_RETRIES", "3")),
-        "retry_delay": float(os.environ.get("SCOUTFS_RETRY_DELAY", "1.0")),
+        "max_retries": _env_num("SCOUTFS_MAX_RETRIES", "3", int),
+        "retry_delay": _env_num("SCOUTFS_RETRY_DELAY", "1.0", float),
         # Caching
-        "token_cache_ttl": int(
-            os.environ.get("SCOUTFS_TOKEN_CACHE_TTL", "300")
+        "token_cache_ttl": _env_num(
+            "SCOUTFS_TOKEN_CACHE_TTL", "300", int
         ),  # 5 minutes
     }
 
+
+class ScoutFSConfig:
+    """Configuration helper for ScoutFS connections.
+
+    This class handles loading and managing configuration for ScoutFS connections,
+    with support for environment variables and programmatic overrides.
+
+    Attributes
+    ----------
+    DEFAULT_CONFIG : dict
+        Dictionary containing default configuration values loaded from environment variables.
+        Includes API settings, authentication, SSL/TLS, timeouts, and retry logic.
+        Environment variables are read at import and again whenever
+        :meth:`reload_defaults` is called.
+    """
+
+    # Default configuration values
+    DEFAULT_CONFIG = _build_defaults()
+
+    @staticmethod
+    def reload_defaults() -> None:
+        """Re-read the defaults from the environment.
+
+        This always replaces ``ScoutFSConfig.DEFAULT_CONFIG``, even when
+        called on a subclass. Subclasses that define their own
+        ``DEFAULT_CONFIG`` keep it; those that don't see the new defaults.
+
+        Examples
+        --------
+        >>> # After changing SCOUTFS_* environment variables
+        >>> ScoutFSConfig.reload_defaults()
+        >>> config = ScoutFSConfig.load()
+        """
+        ScoutFSConfig.DEFAULT_CONFIG = _build_defaults()
+
+    # Alias of reload_defaults
+    clear_cache = reload_defaults
+
     @classmethod
     def load(
         cls, config: Optional[Union[Dict[str, Any], str]] = None
@@ -74,30 +137,31 @@ class ScoutFSConfig:
         >>> # With programmatic overrides
         >>> config = ScoutFSConfig.load({"username": "user", "password": "pass"})
         """
-        result = cls.DEFAULT_CONFIG.copy()
-
         if config is None:
-            return result
+            return cls.DEFAULT_CONFIG.copy()
 
-        if isinstance(config, str):
-            # TODO: Implement loading from config file
+        if not isinstance(config, dict):
+            # TODO: Implement loading from config file if config is a str
             # For now, we'll just return the defaults
-            return result
+            return cls.load()
+
+        result = cls.DEFAULT_CONFIG.copy()
 
-        if isinstance(config, dict):
-            # Update with provided config, filtering out None values
-            result.update({k: v for k, v in config.items() if v is not None})
+        # Update with provided config, filtering out None values
+        for key, value in config.items():
+            if value is not None:
+                result[key] = value
 
         return result
 
     @classmethod
-    def validate(cls, config: Dict[str, Any]) -> None:
+    def validate(cls, config: Mapping[str, Any]) -> None:
         """Validate the configuration.
 
         Parameters
         ----------
-        config : dict
-            The configuration dictionary to validate
+        config : Mapping
+            The configuration mapping to validate
 
         Raises
         ------
@@ -105,12 +169,10 @@ class ScoutFSConfig:
             If the configuration is missing required fields or is invalid
         """
         if not config.get("username") or not config.get("password"):
-            raise ValueError(
-                "Both username and password must be provided for authentication"
-            )
+            raise ValueError(_AUTH_MSG)
 
-        if not config["api_url"].startswith(("http://", "https://")):
-            raise ValueError("API URL must start with http:// or https://")
+        if not config["api_url"].startswith(_URL_SCHEMES):
+            raise ValueError(_URL_MSG)
 
 
 def get_scoutfs_config(**overrides) -> Dict[str, Any]:
@@ -1,4 +1,5 @@
 import os
+from collections import OrderedDict
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,9 @@ os.environ["SCOUTFS_API_VERSION"] = "1"
 # Now import the module with the environment variables set
 from scoutfs.config import ScoutFSConfig, get_scoutfs_config
 
+# SCOUTFS_* variables present in the environment, cleared before each test
+_SCOUTFS_ENV_KEYS = tuple(k for k in os.environ if k.startswith("SCOUTFS_"))
+
 
 class TestScoutFSConfig:
     """Test suite for ScoutFSConfig class."""
@@ -21,9 +25,8 @@ class TestScoutFSConfig:
     def setup_env(self, monkeypatch):
         """Set up test environment with default values."""
         # Clear any existing environment variables that might affect tests
-        for key in os.environ:
-            if key.startswith("SCOUTFS_"):
-                monkeypatch.delenv(key, raising=False)
+        for key in _SCOUTFS_ENV_KEYS:
+            monkeypatch.delenv(key, raising=False)
 
         # Set default test values
         monkeypatch.setenv("SCOUTFS_USERNAME", "testuser")
@@ -31,11 +34,15 @@ class TestScoutFSConfig:
         monkeypatch.setenv("SCOUTFS_API_HOST", "test.host")
         monkeypatch.setenv("SCOUTFS_API_PORT", "8080")
         monkeypatch.setenv("SCOUTFS_API_VERSION", "1")
+        ScoutFSConfig.reload_defaults()
+        yield
+        ScoutFSConfig.reload_defaults()
 
     def test_load_defaults(self):
         """Test loading configuration with default values."""
         config = ScoutFSConfig.load()
 
+        assert type(config) is dict
         assert config["username"] == "testuser"
         assert config["password"] == "testpass"
         assert config["api_url"] == "https://test.host:8080/v1"
@@ -63,6 +70,46 @@ class TestScoutFSConfig:
         # Other values should remain as defaults
         assert config["api_url"] == "https://test.host:8080/v1"
 
+    def test_load_subclass_defaults(self):
+        """Test that load() honours DEFAULT_CONFIG overridden in a subclass."""
+
+        class CustomConfig(ScoutFSConfig):
+            DEFAULT_CONFIG = {
+                "api_url": "https://custom.host:9000/v2",
+                "username": "custom_user",
+                "password": "custom_pass",
+            }
+
+        assert CustomConfig.load()["api_url"] == "https://custom.host:9000/v2"
+        config = CustomConfig.load({"password": "override_pass"})
+        assert config["username"] == "custom_user"
+        assert config["password"] == "override_pass"
+        # The base class is unaffected
+        assert ScoutFSConfig.load()["api_url"] == "https://test.host:8080/v1"
+
+    def test_load_patched_defaults(self):
+        """Test that load() honours a patched DEFAULT_CONFIG."""
+        defaults = {"api_url": "https://patched.host/v1"}
+        with patch.object(ScoutFSConfig, "DEFAULT_CONFIG", defaults):
+            assert ScoutFSConfig.load()["api_url"] == "https://patched.host/v1"
+        assert ScoutFSConfig.load()["api_url"] == "https://test.host:8080/v1"
+
+    def test_load_dict_subclass(self):
+        """Test that dict subclasses are accepted as overrides."""
+        config = ScoutFSConfig.load(OrderedDict(username="override_user"))
+
+        assert config["username"] == "override_user"
+        assert config["password"] == "testpass"
+
+    def test_load_overrides_do_not_touch_defaults(self):
+        """Test that writing to a loaded config leaves the defaults alone."""
+        config = ScoutFSConfig.load({"password": "override_pass"})
+        config["username"] = "changed_user"
+
+        assert config["username"] == "changed_user"
+        assert ScoutFSConfig.load()["username"] == "testuser"
+        assert ScoutFSConfig.load()["password"] == "testpass"
+
     def test_validate_success(self):
         """Test successful validation of configuration."""
         config = {
@@ -102,6 +149,20 @@ class TestScoutFSConfig:
             ScoutFSConfig.validate(config)
         assert "must start with http:// or https://" in str(excinfo.value)
 
+    def test_validate_repeated(self):
+        """Test that repeated validation still rejects changed settings."""
+        config = {
+            "username": "testuser",
+            "password": "testpass",
+            "api_url": "https://test.host:8080/v1",
+        }
+        ScoutFSConfig.validate(config)
+        ScoutFSConfig.validate(config)
+
+        config["password"] = ""
+        with pytest.raises(ValueError):
+            ScoutFSConfig.validate(config)
+
     def test_environment_variables(self, monkeypatch):
         """Test loading configuration from environment variables."""
         monkeypatch.setenv("SCOUTFS_API_HOST", "custom.host")
@@ -109,26 +170,57 @@ class TestScoutFSConfig:
         monkeypatch.setenv("SCOUTFS_API_VERSION", "2")
         monkeypatch.setenv("SCOUTFS_SSL_VERIFY", "true")
 
-        # Need to reload the module to pick up the new environment variables
-        with patch.dict(
-            "os.environ",
-            {
-                "SCOUTFS_API_HOST": "custom.host",
-                "SCOUTFS_API_PORT": "9000",
-                "SCOUTFS_API_VERSION": "2",
-                "SCOUTFS_SSL_VERIFY": "true",
-            },
-        ):
-            from importlib import reload
+        # Need to clear the cache to pick up the new environment variables
+        ScoutFSConfig.reload_defaults()
+
+        config = ScoutFSConfig.load()
+        assert config["api_url"] == "https://custom.host:9000/v2"
+        assert config["ssl_verify"] is True
+
+    def test_api_url_takes_precedence(self, monkeypatch):
+        """Test that SCOUTFS_API_URL overrides host, port and version."""
+        monkeypatch.setenv("SCOUTFS_API_URL", "http://direct.host/api")
+        ScoutFSConfig.reload_defaults()
+
+        config = ScoutFSConfig.load()
+        assert config["api_url"] == "http://direct.host/api"
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("true", True),
+            ("True", True),
+            ("1", True),
+            ("yes", True),
+            ("on", True),
+            ("false", False),
+            ("0", False),
+            ("", False),
+        ],
+    )
+    def test_ssl_verify_parsing(self, monkeypatch, value, expected):
+        """Test the accepted spellings of SCOUTFS_SSL_VERIFY."""
+        monkeypatch.setenv("SCOUTFS_SSL_VERIFY", value)
+        ScoutFSConfig.reload_defaults()
+
+        assert ScoutFSConfig.load()["ssl_verify"] is expected
+
+    def test_defaults_are_cached(self, monkeypatch):
+        """Test that environment changes are only seen after a reload."""
+        assert ScoutFSConfig.load()["username"] == "testuser"
 
-            from scoutfs import config
+        monkeypatch.setenv("SCOUTFS_USERNAME", "changed_user")
+        assert ScoutFSConfig.load()["username"] == "testuser"
 
-            reload(config)
-            from scoutfs.config import ScoutFSConfig
+        ScoutFSConfig.reload_defaults()
+        assert ScoutFSConfig.load()["username"] == "changed_user"
 
-            config = ScoutFSConfig.load()
-            assert config["api_url"] == "https://custom.host:9000/v2"
-            assert config["ssl_verify"] is True
+    def test_clear_cache_alias(self, monkeypatch):
+        """Test that clear_cache is an alias of reload_defaults."""
+        monkeypatch.setenv("SCOUTFS_USERNAME", "changed_user")
+        ScoutFSConfig.clear_cache()
+
+        assert ScoutFSConfig.load()["username"] == "changed_user"
 
     def test_get_scoutfs_config_helper(self):
         """Test the get_scoutfs_config helper function."""
@@ -139,37 +231,20 @@ class TestScoutFSConfig:
         assert config["username"] == "helper_user"
         assert config["password"] == "helper_pass"
         assert config["ssl_verify"] is True
+        assert type(config) is dict
 
     def test_none_values_in_overrides(self):
         """Test that None values in overrides don't override existing values."""
-        # First set up the defaults
-        with patch.dict(
-            "os.environ",
-            {
-                "SCOUTFS_USERNAME": "testuser",
-                "SCOUTFS_PASSWORD": "testpass",
-                "SCOUTFS_API_HOST": "test.host",
-                "SCOUTFS_API_PORT": "8080",
-                "SCOUTFS_API_VERSION": "1",
-            },
-        ):
-            from importlib import reload
-
-            from scoutfs import config
-
-            reload(config)
-            from scoutfs.config import ScoutFSConfig
-
-            overrides = {
-                "username": None,  # Should be ignored
-                "password": "newpass",
-                "new_key": None,  # Should vanish
-            }
-            config = ScoutFSConfig.load(overrides)
-
-            # Username should keep its default value, not be set to None
-            assert config["username"] == "testuser"
-            assert config["password"] == "newpass"
-            assert (
-                "new_key" not in config
-            )  # This has nothing to do with ScoutFSConfig, so it should vanish
+        overrides = {
+            "username": None,  # Should be ignored
+            "password": "newpass",
+            "new_key": None,  # Should vanish
+        }
+        config = ScoutFSConfig.load(overrides)
+
+        # Username should keep its default value, not be set to None
+        assert config["username"] == "testuser"
+        assert config["password"] == "newpass"
+        assert (
+            "new_key" not in config
+        )  # This has nothing to do with ScoutFSConfig, so it should vanish